@@ -1,12 +1,33 @@
+import io
 import os
 import sys
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 import worker
 
 
+class RecordingWriter:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    def flush(self):
+        pass
+
+
+def run_main(data, writer):
+    stdin = SimpleNamespace(buffer=SimpleNamespace(raw=io.BytesIO(data)))
+    stdout = SimpleNamespace(buffer=writer)
+    with mock.patch.object(sys, "stdin", stdin), mock.patch.object(sys, "stdout", stdout):
+        worker.main()
+
+
 class WorkerTests(unittest.TestCase):
     def test_normalize_params_flattens_single_list(self):
         params = [["Lunu User"]]
@@ -28,6 +49,84 @@ class WorkerTests(unittest.TestCase):
         result = worker.handle("hello", [["Lunu User"]])
         self.assertEqual(result["result"], "Hello from Python")
 
+    def test_handle_unknown_method(self):
+        result = worker.handle("missing", [])
+        self.assertEqual(result["error"]["code"], "method_not_found")
+
+    def test_respond_blank_line(self):
+        self.assertIsNone(worker.respond(b"  \r"))
+
+    def test_respond_invalid_json(self):
+        self.assertIsNone(worker.respond(b"{not json"))
+
+    def test_respond_missing_id_or_method(self):
+        self.assertIsNone(worker.respond(b'{"method":"hello"}'))
+        self.assertIsNone(worker.respond(b'{"id":1}'))
+
+    def test_respond_valid_request(self):
+        out = worker.respond(b'{"id":7,"method":"echo","params":[["Lunu User"]]}')
+        self.assertEqual(out, worker.dumps({"result": "Lunu User", "id": 7}) + b"\n")
+
+    def test_main_answers_final_line_without_newline(self):
+        writer = RecordingWriter()
+        run_main(b'{"id":1,"method":"hello"}', writer)
+        self.assertEqual(writer.writes, [worker.dumps({"result": "Hello from Python", "id": 1}) + b"\n"])
+
+    def test_main_batches_pipelined_replies(self):
+        writer = RecordingWriter()
+        run_main(b'{"id":1,"method":"hello"}\n{"id":2,"method":"echo","params":[["x"]]}\n', writer)
+        expected = (
+            worker.dumps({"result": "Hello from Python", "id": 1}) + b"\n"
+            + worker.dumps({"result": "x", "id": 2}) + b"\n"
+        )
+        self.assertEqual(writer.writes, [expected])
+
+    def test_main_flushes_earlier_replies_when_a_line_fails(self):
+        handle = worker.handle
+
+        def failing_handle(method, params):
+            if method == "boom":
+                raise RuntimeError("boom")
+            return handle(method, params)
+
+        writer = RecordingWriter()
+        with mock.patch.object(worker, "handle", failing_handle):
+            with self.assertRaises(RuntimeError):
+                run_main(b'{"id":1,"method":"hello"}\n{"id":2,"method":"boom"}\n', writer)
+        self.assertEqual(writer.writes, [worker.dumps({"result": "Hello from Python", "id": 1}) + b"\n"])
+
+    def test_split_lines_keeps_partial_tail(self):
+        buffer = bytearray(b'{"id":1}\n{"id":2}\n{"id"')
+        lines = worker.split_lines(buffer)
+        self.assertEqual(lines, [b'{"id":1}', b'{"id":2}'])
+        self.assertEqual(buffer, bytearray(b'{"id"'))
+
+    def test_split_lines_searches_from_offset(self):
+        buffer = bytearray(b'{"id":1}\n{"id":2}\n')
+        self.assertEqual(worker.split_lines(buffer, 9), [b'{"id":1}\n{"id":2}'])
+        self.assertEqual(buffer, bytearray())
+
+    def test_main_answers_final_line_split_across_reads(self):
+        writer = RecordingWriter()
+        with mock.patch.object(worker, "READ_CHUNK_SIZE", 8):
+            run_main(b'{"id":1,"method":"hello"}\n{"id":2,"method":"hello"}', writer)
+        self.assertEqual(
+            b"".join(writer.writes),
+            worker.dumps({"result": "Hello from Python", "id": 1}) + b"\n"
+            + worker.dumps({"result": "Hello from Python", "id": 2}) + b"\n",
+        )
+
+    def test_main_joins_line_split_across_reads(self):
+        writer = RecordingWriter()
+        with mock.patch.object(worker, "READ_CHUNK_SIZE", 8):
+            run_main(b'{"id":1,"method":"echo","params":[["' + b"x" * 40 + b'"]]}\n', writer)
+        self.assertEqual(b"".join(writer.writes), worker.dumps({"result": "x" * 40, "id": 1}) + b"\n")
+
+    def test_split_lines_without_newline(self):
+        buffer = bytearray(b'{"id":1')
+        self.assertEqual(worker.split_lines(buffer), [])
+        self.assertEqual(buffer, bytearray(b'{"id":1'))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,45 +1,103 @@
 import sys
-import json
+
+try:
+    from orjson import dumps, loads
+except ImportError:
+    import json
+    from json import loads
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+READ_CHUNK_SIZE = 65536
 
 
 def normalize_params(params):
-    if len(params) == 1 and isinstance(params[0], list):
+    if len(params) == 1 and type(params[0]) is list:
         return params[0]
     return params
 
 
-def handle(method, params):
-    params = normalize_params(params)
-    if method == "hello":
-        return {"result": "Hello from Python"}
-    if method == "echo":
-        if len(params) > 0:
-            return {"result": params[0]}
-        return {"result": None}
+def _hello(params):
+    return {"result": "Hello from Python"}
+
+
+def _echo(params):
+    if len(params) > 0:
+        return {"result": params[0]}
+    return {"result": None}
+
+
+def _method_not_found(params):
     return {"error": {"code": "method_not_found", "message": "Method not found"}}
 
 
+METHODS = {
+    "hello": _hello,
+    "echo": _echo,
+}
+
+
+def handle(method, params):
+    return METHODS.get(method, _method_not_found)(normalize_params(params))
+
+
+def respond(line):
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        payload = loads(line)
+    except Exception:
+        return None
+    request_id = payload.get("id")
+    method = payload.get("method")
+    params = payload.get("params", [])
+    if request_id is None or method is None:
+        return None
+    response = handle(method, params)
+    response["id"] = request_id
+    return dumps(response) + b"\n"
+
+
+def split_lines(buffer, search_from=0):
+    lines = []
+    start = 0
+    end = buffer.find(b"\n", search_from)
+    while end != -1:
+        lines.append(buffer[start:end])
+        start = end + 1
+        end = buffer.find(b"\n", start)
+    del buffer[:start]
+    return lines
+
+
 def main():
+    stdin = sys.stdin.buffer.raw
+    stdout = sys.stdout.buffer
+    chunk = memoryview(bytearray(READ_CHUNK_SIZE))
+    buffer = bytearray()
     while True:
-        line = sys.stdin.readline()
-        if line == "":
+        size = stdin.readinto(chunk)
+        if not size:
             break
-        line = line.strip()
-        if line == "":
-            continue
+        search_from = len(buffer)
+        buffer.extend(chunk[:size])
+        outs = []
         try:
-            payload = json.loads(line)
-        except Exception:
-            continue
-        request_id = payload.get("id")
-        method = payload.get("method")
-        params = payload.get("params", [])
-        if request_id is None or method is None:
-            continue
-        response = handle(method, params)
-        response["id"] = request_id
-        sys.stdout.write(json.dumps(response) + "\n")
-        sys.stdout.flush()
+            for line in split_lines(buffer, search_from):
+                out = respond(line)
+                if out is not None:
+                    outs.append(out)
+        finally:
+            if outs:
+                stdout.write(b"".join(outs))
+                stdout.flush()
+    out = respond(buffer)
+    if out is not None:
+        stdout.write(out)
+        stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 use axum::{
     extract::{Path, State},
-    http::{HeaderMap, StatusCode},
+    http::{header, HeaderMap, StatusCode},
     middleware,
     response::{IntoResponse, Response},
     routing::{get, post},
@@ -13,8 +13,9 @@ use std::{
     net::SocketAddr,
     path::{Path as StdPath, PathBuf},
     sync::Arc,
-    time::Duration,
+    time::{Duration, SystemTime},
 };
+use tokio::fs as async_fs;
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
 use tokio::process::{ChildStdin, Command};
 use tokio::sync::{Mutex, oneshot};
@@ -63,6 +64,7 @@ struct AppState {
     _base_dir: PathBuf,
     modules_dir: PathBuf,
     workers: Mutex<HashMap<String, Arc<WorkerHandle>>>,
+    bridge_configs: Mutex<HashMap<String, CachedBridgeConfig>>,
 }
 
 #[derive(Deserialize)]
@@ -103,6 +105,11 @@ struct MethodSpec {
     timeout_ms: Option<u64>,
 }
 
+struct CachedBridgeConfig {
+    modified: Option<SystemTime>,
+    config: Arc<BridgeConfig>,
+}
+
 struct WorkerHandle {
     stdin: Mutex<ChildStdin>,
     pending: Mutex<HashMap<String, oneshot::Sender<Result<Value, WorkerError>>>>,
@@ -142,6 +149,7 @@ pub async fn run() -> anyhow::Result<()> {
         _base_dir: base_dir,
         modules_dir,
         workers: Mutex::new(HashMap::new()),
+        bridge_configs: Mutex::new(HashMap::new()),
     });
 
     if state.config.server.ssl_enabled {
@@ -154,10 +162,11 @@ pub async fn run() -> anyhow::Result<()> {
         .route("/api/v1/:module_name/:func_name", post(module_bridge))
         .layer(middleware::from_fn_with_state(state.clone(), auth_middleware));
 
+    // /health is added after the host layer so liveness probes skip it.
     let app = Router::new()
-        .route("/health", get(health))
         .merge(protected)
         .layer(middleware::from_fn_with_state(state.clone(), host_middleware))
+        .route("/health", get(health))
         .with_state(state);
 
     let addr: SocketAddr = format!("{}:{}", host, port).parse()?;
@@ -210,8 +219,10 @@ fn load_or_create_secrets(base_dir: &PathBuf) -> anyhow::Result<Secrets> {
     Ok(secrets)
 }
 
+const HEALTH_BODY: &str = r#"{"status":"ok","system":"Lunu"}"#;
+
 async fn health() -> impl IntoResponse {
-    Json(json!({ "status": "ok", "system": "Lunu" }))
+    ([(header::CONTENT_TYPE, "application/json")], HEALTH_BODY)
 }
 
 async fn system_info(State(state): State<Arc<AppState>>) -> impl IntoResponse {
@@ -244,19 +255,18 @@ async fn module_bridge(
     }
 
     let module_dir = state.modules_dir.join(&module_name);
-    if !module_dir.is_dir() {
-        return Err(AppError::new(StatusCode::NOT_FOUND, "Module not found"));
-    }
-
     let cfg_path = module_dir.join("bridge.json");
-    if !cfg_path.is_file() {
-        return Err(AppError::new(StatusCode::NOT_FOUND, "Bridge config not found"));
-    }
+    let cfg_meta = match async_fs::metadata(&cfg_path).await {
+        Ok(meta) if meta.is_file() => meta,
+        _ => {
+            if !async_fs::metadata(&module_dir).await.map(|m| m.is_dir()).unwrap_or(false) {
+                return Err(AppError::new(StatusCode::NOT_FOUND, "Module not found"));
+            }
+            return Err(AppError::new(StatusCode::NOT_FOUND, "Bridge config not found"));
+        }
+    };
 
-    let cfg_content = std::fs::read_to_string(&cfg_path)
-        .map_err(|_| AppError::new(StatusCode::INTERNAL_SERVER_ERROR, "Failed to read bridge config"))?;
-    let cfg: BridgeConfig = serde_json::from_str(&cfg_content)
-        .map_err(|_| AppError::new(StatusCode::BAD_REQUEST, "Invalid bridge config"))?;
+    let cfg = load_bridge_config(&state, &module_name, &cfg_path, cfg_meta.modified().ok()).await?;
 
     let spec = cfg.methods.get(&func_name)
         .ok_or_else(|| AppError::new(StatusCode::NOT_FOUND, "Function not found"))?;
@@ -312,6 +322,34 @@ async fn module_bridge(
     Ok(Json(json!({ "result": response })))
 }
 
+async fn load_bridge_config(
+    state: &Arc<AppState>,
+    module_name: &str,
+    cfg_path: &PathBuf,
+    modified: Option<SystemTime>,
+) -> Result<Arc<BridgeConfig>, AppError> {
+    // Reuse the parsed config until bridge.json changes on disk.
+    if modified.is_some() {
+        if let Some(cached) = state.bridge_configs.lock().await.get(module_name) {
+            if cached.modified == modified {
+                return Ok(cached.config.clone());
+            }
+        }
+    }
+
+    let cfg_content = async_fs::read_to_string(cfg_path)
+        .await
+        .map_err(|_| AppError::new(StatusCode::INTERNAL_SERVER_ERROR, "Failed to read bridge config"))?;
+    let cfg: BridgeConfig = serde_json::from_str(&cfg_content)
+        .map_err(|_| AppError::new(StatusCode::BAD_REQUEST, "Invalid bridge config"))?;
+    let cfg = Arc::new(cfg);
+    state.bridge_configs.lock().await.insert(
+        module_name.to_string(),
+        CachedBridgeConfig { modified, config: cfg.clone() },
+    );
+    Ok(cfg)
+}
+
 fn is_safe_path(base: &PathBuf, target: &PathBuf) -> bool {
     // 1. Check if target starts with base (simple check)
     if target.starts_with(base) {